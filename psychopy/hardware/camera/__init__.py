@@ -22,7 +22,7 @@ __all__ = [
     'CAMERA_TEMP_FILE_AUDIO',
     'CAMERA_API_AVFOUNDATION',
     'CAMERA_API_DIRECTSHOW',
-    # 'CAMERA_API_VIDEO4LINUX',
+    'CAMERA_API_VIDEO4LINUX',
     # 'CAMERA_API_OPENCV',
     'CAMERA_API_UNKNOWN',
     'CAMERA_API_NULL',
@@ -34,19 +34,23 @@ __all__ = [
     'PlayerNotAvailableError',
     'Camera',
     'CameraInfo',
+    'CameraInfoTable',
     'StreamData',
     'getCameras',
+    'getCameraTable',
     'getCameraDescriptions',
     'renderVideo'
 ]
 
 
 import platform
+import sys
 import numpy as np
 import tempfile
 import os
 import os.path
 import shutil
+import subprocess
 import math
 from psychopy.constants import STOPPED, NOT_STARTED, RECORDING, STARTED, \
     STOPPING, PAUSED, FINISHED, INVALID
@@ -55,19 +59,16 @@ from psychopy.visual.movies.frame import MovieFrame, NULL_MOVIE_FRAME_INFO
 from psychopy.sound.microphone import Microphone
 import psychopy.logging as logging
 from ffpyplayer.player import MediaPlayer
-from ffpyplayer.writer import MediaWriter
 from ffpyplayer.pic import SWScale
 from ffpyplayer.tools import list_dshow_devices, get_format_codec
-# Something in moviepy.editor's initialisation breaks Mouse, so import these
-# from the source instead
-# from moviepy.editor import VideoFileClip, AudioFileClip, CompositeAudioClip
-from moviepy.video.io.VideoFileClip import VideoFileClip
-from moviepy.audio.io.AudioFileClip import AudioFileClip
-from moviepy.audio.AudioClip import CompositeAudioClip
+# NB - `MediaWriter` and `imageio_ffmpeg` are imported lazily at their call
+# sites so users that only enumerate cameras don't have to pay the import
+# cost up front.
 import uuid
 import threading
 import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
 # import cv2  # used to get camera information
 
 
@@ -76,6 +77,10 @@ import time
 #
 
 VIDEO_DEVICE_ROOT_LINUX = '/dev'
+# Name of the platform we're running on, cached at import since it cannot
+# change within a session and `platform.system()` goes through several layers
+# of Python each call.
+_SYSTEM = platform.system()
 CAMERA_UNKNOWN_VALUE = u'Unknown'  # fields where we couldn't get a value
 CAMERA_NULL_VALUE = u'Null'  # fields where we couldn't get a value
 # camera operating modes
@@ -89,7 +94,7 @@ CAMERA_TEMP_FILE_AUDIO = u'audio.wav'
 # camera API flags, these specify which API camera settings were queried with
 CAMERA_API_AVFOUNDATION = u'AVFoundation'  # mac
 CAMERA_API_DIRECTSHOW = u'DirectShow'      # windows
-# CAMERA_API_VIDEO4LINUX = u'Video4Linux'    # linux
+CAMERA_API_VIDEO4LINUX = u'Video4Linux'    # linux
 # CAMERA_API_OPENCV = u'OpenCV'              # opencv, cross-platform API
 CAMERA_API_UNKNOWN = u'Unknown'            # unknown API
 CAMERA_API_NULL = u'Null'                  # empty field
@@ -103,6 +108,16 @@ CAMERA_LIB_NULL = u'Null'
 CAMERA_FRAMERATE_NOMINAL_NTSC = '30.000030'
 CAMERA_FRAMERATE_NTSC = 30.000030
 
+# Interned copy of the end-of-file status string ffpyplayer reports. Checking
+# per-frame status against this sentinel lets CPython's string comparison take
+# the pointer-equality fast path when the player returns the interned object.
+_EOF = sys.intern('eof')
+
+# Maximum number of frames allowed to queue up for the writer thread before
+# the stream reader starts dropping them. Keeps memory use bounded when the
+# encoder cannot keep up with the capture rate.
+CAMERA_MAX_PENDING_WRITES = 8
+
 # FourCC and pixel format mappings, mostly used with AVFoundation to determine
 # the FFMPEG decoder which is most suitable for it. Please expand this if you
 # know any more!
@@ -209,6 +224,30 @@ class CameraInfo:
         self.cameraLib = cameraLib
         self.cameraAPI = cameraAPI
 
+        if __debug__:  # stripped entirely when running under `-O`
+            self._validate()
+
+    def _validate(self):
+        """Check that the values given to this descriptor are sane.
+
+        Validation is done once at construction rather than in each property
+        setter, which keeps construction cheap when enumerating systems with
+        many cameras and formats. It is skipped altogether when the
+        interpreter runs with optimizations enabled (`-O`).
+
+        Raises
+        ------
+        ValueError
+            A field of this descriptor holds an invalid value.
+
+        """
+        frameSize = self._frameSize
+        if len(frameSize) != 2:
+            raise ValueError("Value for `frameSize` must have length 2.")
+        if not (isinstance(frameSize[0], int)
+                and isinstance(frameSize[1], int)):
+            raise ValueError("Values for `frameSize` must be integers.")
+
     def __repr__(self):
         return (f"CameraInfo(index={repr(self.index)}, "
                 f"name={repr(self.name)}, "
@@ -250,11 +289,7 @@ class CameraInfo:
 
     @frameSize.setter
     def frameSize(self, value):
-        assert len(value) == 2, "Value for `frameSize` must have length 2."
-        assert all([isinstance(i, int) for i in value]), (
-            "Values for `frameSize` must be integers.")
-
-        self._frameSize = value
+        self._frameSize = tuple(value)
 
     @property
     def frameRate(self):
@@ -350,6 +385,154 @@ class CameraInfo:
         )
 
 
+class CameraInfoTable:
+    """Tabular (structure-of-arrays) store for camera enumeration results.
+
+    Camera formats are stored as parallel NumPy arrays rather than a list of
+    `CameraInfo` objects. This allows queries over many formats (e.g. "which
+    formats support 60Hz?") to be computed as single vectorized comparisons
+    instead of attribute lookups over N Python objects. Equivalent
+    `CameraInfo` instances are created lazily on demand for compatibility
+    with code expecting them.
+
+    Parameters
+    ----------
+    cameraInfos : list of CameraInfo
+        Camera formats to populate the table with, usually obtained through
+        platform enumeration (see `getCameras`).
+
+    """
+    __slots__ = [
+        '_indices',
+        '_names',
+        '_frameSizes',
+        '_frameRates',
+        '_pixelFormats',
+        '_codecFormats',
+        '_cameraLibs',
+        '_cameraAPIs'
+    ]
+
+    def __init__(self, cameraInfos=()):
+        nFormats = len(cameraInfos)
+        self._indices = np.empty((nFormats,), dtype=np.int32)
+        self._names = np.empty((nFormats,), dtype=object)
+        self._frameSizes = np.empty((nFormats, 2), dtype=np.int32)
+        self._frameRates = np.empty((nFormats,), dtype=np.float64)
+        self._pixelFormats = np.empty((nFormats,), dtype=object)
+        self._codecFormats = np.empty((nFormats,), dtype=object)
+        self._cameraLibs = np.empty((nFormats,), dtype=object)
+        self._cameraAPIs = np.empty((nFormats,), dtype=object)
+
+        for i, info in enumerate(cameraInfos):
+            self._indices[i] = info.index
+            self._names[i] = info.name
+            self._frameSizes[i, :] = info.frameSize
+            # `frameRate` may be a scalar or a `(min, max)` range depending on
+            # the API which enumerated the format (and defaults to a tuple),
+            # keep the highest rate the format supports in either case
+            frameRate = info.frameRate
+            if hasattr(frameRate, '__len__'):
+                frameRate = max(frameRate)
+            self._frameRates[i] = float(frameRate)
+            self._pixelFormats[i] = info.pixelFormat
+            self._codecFormats[i] = info.codecFormat
+            self._cameraLibs[i] = info.cameraLib
+            self._cameraAPIs[i] = info.cameraAPI
+
+    def __len__(self):
+        return len(self._names)
+
+    @property
+    def names(self):
+        """Camera names per format (`ndarray`, dtype `object`)."""
+        return self._names
+
+    @property
+    def frameSizes(self):
+        """Frame sizes as rows of `(w, h)` (`ndarray`, shape `(N, 2)`)."""
+        return self._frameSizes
+
+    @property
+    def frameRates(self):
+        """Nominal frame rates per format (`ndarray`, dtype `float64`)."""
+        return self._frameRates
+
+    @property
+    def pixelFormats(self):
+        """Pixel formats per format (`ndarray`, dtype `object`)."""
+        return self._pixelFormats
+
+    @property
+    def codecFormats(self):
+        """Codec formats per format (`ndarray`, dtype `object`)."""
+        return self._codecFormats
+
+    @property
+    def cameraLibs(self):
+        """Camera libraries per format (`ndarray`, dtype `object`)."""
+        return self._cameraLibs
+
+    def supportedFrameRate(self, frameRate):
+        """Get which formats support a given frame rate.
+
+        Parameters
+        ----------
+        frameRate : float
+            Frame rate in Hertz the camera format must support.
+
+        Returns
+        -------
+        ndarray
+            Boolean mask over the table where `True` indicates the format can
+            run at `frameRate`.
+
+        """
+        return self._frameRates >= float(frameRate)
+
+    def supportedFrameSize(self, frameSize):
+        """Get which formats support a given frame size.
+
+        Parameters
+        ----------
+        frameSize : ArrayLike
+            Frame size `(w, h)` in pixels the camera format must match.
+
+        Returns
+        -------
+        ndarray
+            Boolean mask over the table where `True` indicates the format
+            matches `frameSize`.
+
+        """
+        frameSize = np.asarray(frameSize, dtype=np.int32)
+        return np.all(self._frameSizes == frameSize, axis=1)
+
+    def getCameraInfo(self, index):
+        """Get a `CameraInfo` instance for a row of the table.
+
+        Parameters
+        ----------
+        index : int
+            Row of the table to create a descriptor for.
+
+        Returns
+        -------
+        CameraInfo
+            Camera format descriptor equivalent to the table row.
+
+        """
+        return CameraInfo(
+            index=int(self._indices[index]),
+            name=self._names[index],
+            frameSize=tuple(int(i) for i in self._frameSizes[index]),
+            frameRate=float(self._frameRates[index]),
+            pixelFormat=self._pixelFormats[index],
+            codecFormat=self._codecFormats[index],
+            cameraLib=self._cameraLibs[index],
+            cameraAPI=self._cameraAPIs[index])
+
+
 class StreamStatus:
     """Descriptor class for stream status.
 
@@ -536,6 +719,13 @@ class StreamWriterThread(threading.Thread):
         self._warmUpLock.acquire(blocking=False)
         writer = None   # instance for the writer
         filepath = ''  # path to the file
+        sws = None     # pixel format conversion context, built on first frame
+        swsKey = None  # frame format `(w, h, pixelFormat)` that `sws` handles
+        # Bound methods for the per-frame path, hoisted whenever the writer or
+        # conversion context changes so the hot loop skips the attribute
+        # lookups entirely.
+        writerWriteFrame = None
+        swsScale = None
         alive = True
         while alive:
             # block main thread until we are in the command loop
@@ -552,8 +742,10 @@ class StreamWriterThread(threading.Thread):
                         "without closing the existing one first."
                     )
                 filepath, writerOpts = cmdVals
-                # create a new writer instance
+                # create a new writer instance, import deferred until needed
+                from ffpyplayer.writer import MediaWriter
                 writer = MediaWriter(filepath, writerOpts)
+                writerWriteFrame = writer.write_frame
                 self._commandQueue.task_done()
             elif cmdOptCode == 'write_frame':  # write a frame
                 # Write a frame out to the file. Passing a boolean as arg[3]
@@ -571,13 +763,22 @@ class StreamWriterThread(threading.Thread):
                     self._commandQueue.task_done()
 
                 frameWidth, frameHeight = colorData.get_size()
-                sws = SWScale(frameWidth, frameHeight,
-                    colorData.get_pixel_format(),
-                    ofmt='yuv420p')
+                pixelFormat = colorData.get_pixel_format()
+
+                # Creating an `SWScale` context allocates FFMPEG's scaler
+                # tables and buffers, far too costly to do per-frame. Keep a
+                # single instance around and only rebuild it if the incoming
+                # frame format changes.
+                thisFrameFormat = (frameWidth, frameHeight, pixelFormat)
+                if swsKey != thisFrameFormat:
+                    sws = SWScale(frameWidth, frameHeight, pixelFormat,
+                        ofmt='yuv420p')
+                    swsScale = sws.scale
+                    swsKey = thisFrameFormat
 
                 # write the frame to the file
-                recordingBytes = writer.write_frame(
-                    img=sws.scale(colorData),
+                recordingBytes = writerWriteFrame(
+                    img=swsScale(colorData),
                     pts=pts,
                     stream=0)
 
@@ -599,6 +800,8 @@ class StreamWriterThread(threading.Thread):
                         "without opening on first.")
                 writer.close()
                 writer = None
+                writerWriteFrame = None
+                sws = swsKey = swsScale = None  # format may change next time
                 self._commandQueue.task_done()
             elif cmdOptCode == 'end':  # end the thread
                 alive = False
@@ -754,7 +957,7 @@ class MovieStreamIOThread(threading.Thread):
 
         # status flag equivalents for ffpyplayer
         statusFlagLUT = {
-            'eof': STOPPING,  # maybe FINISHED?
+            _EOF: STOPPING,  # maybe FINISHED?
             'not ready': NOT_STARTED,
             'paused': PAUSED  # not allowed for live feeds but map it anyways
         }
@@ -775,7 +978,7 @@ class MovieStreamIOThread(threading.Thread):
 
             # Should never see this unless the camera was unplugged or
             # something, but we'll handle it here at some point.
-            if val == 'eof':
+            if val == _EOF:
                 break
 
             time.sleep(frameInterval)  # sleep a bit to avoid mashing the CPU
@@ -842,6 +1045,10 @@ class MovieStreamIOThread(threading.Thread):
                     if statusFlag == STARTED:
                         statusFlag = RECORDING
                     writer = cmdVal  # writer object is the argument here
+                    # Ask the OS to schedule this thread ahead of others while
+                    # frames are being committed to file, reducing the chance
+                    # of dropped frames on a loaded system.
+                    _setCurrentThreadPriority(True)
                 elif cmdOpCode == 'stop':
                     # Weird, eh? We use the `STARTED` constant to represent that
                     # the stream is active and pulling frames but not yet
@@ -854,6 +1061,7 @@ class MovieStreamIOThread(threading.Thread):
                         )
                     statusFlag = STARTED
                     writer = None
+                    _setCurrentThreadPriority(False)  # back to normal
                 elif cmdOpCode == 'close':
                     # Exit the thread, the breaks out of this loop and drops out
                     # to the end of the routine. There should be a `task_done()`
@@ -880,14 +1088,17 @@ class MovieStreamIOThread(threading.Thread):
                 time.sleep(frameInterval)
                 continue
 
-            # after getting a frame, we can get accurate metadata
-            metadata = self._player.get_metadata()
-
-            # compute frame interval for dynamic polling rate
+            # Stream metadata is effectively static for a live feed once the
+            # first valid frame has arrived, and `get_metadata()` crosses into
+            # the C layer and builds a fresh dict on every call. Only query
+            # the player again while we don't have a valid frame rate yet.
             frameRate = metadata['frame_rate']
             numer, denom = frameRate
             if denom == 0:  # no valid framerate from metadata yet
-                continue
+                metadata = self._player.get_metadata()
+                numer, denom = metadata['frame_rate']
+                if denom == 0:
+                    continue
 
             # compute the frame interval that will be used
             frameInterval = 1.0 / (numer / float(denom))
@@ -936,13 +1147,22 @@ class MovieStreamIOThread(threading.Thread):
                 # recordingTime = streamTime - ptsStart
 
                 # If we have writer object, put frames in its queue to have them
-                # written to disk.
+                # written to disk. Encoding happens asynchronously on the
+                # writer thread; if it falls behind the capture rate, drop the
+                # frame rather than letting its queue (and memory use) grow
+                # without bound.
                 if writer is not None:
-                    writer.commandQueue.put(
-                        ('write_frame',
-                         (colorData, recordingTime, False)
-                         )
-                    )
+                    if writer.commandQueue.qsize() < CAMERA_MAX_PENDING_WRITES:
+                        writer.commandQueue.put(
+                            ('write_frame',
+                             (colorData, recordingTime, False)
+                             )
+                        )
+                    else:
+                        logging.warning(
+                            "Video encoder cannot keep up with the camera "
+                            "stream, dropping frame at t={}s.".format(
+                                round(recordingTime, 3)))
 
                 # poll the mic if available to flush the sample buffer
                 if self._mic is not None:
@@ -1364,7 +1584,7 @@ class Camera:
         # a sanity check to ensure people aren't using formats obtained from
         # other platforms.
         api = self._cameraInfo.cameraAPI
-        thisSystem = platform.system()
+        thisSystem = _SYSTEM
         if ((api == CAMERA_API_AVFOUNDATION and thisSystem != 'Darwin') or
                 (api == CAMERA_API_DIRECTSHOW and thisSystem != 'Windows')):
             raise RuntimeError(
@@ -1431,6 +1651,13 @@ class Camera:
         # last frame
         self._lastFrame = NULL_MOVIE_FRAME_INFO
 
+        # Pre-allocated frame descriptors, reused alternately across updates
+        # instead of constructing a fresh `MovieFrame` per frame. Double
+        # buffering gives a consumer holding `lastFrame` a full update
+        # interval before the descriptor's fields are written over.
+        self._frameSlots = (MovieFrame(), MovieFrame())
+        self._frameSlotIdx = 0
+
         # Thread for rendering videos in the background, always open across the
         # lifetime of the Camera stream being open. This allows video
         # compositing/rendering to be done in parallel with another recording
@@ -1482,7 +1709,7 @@ class Camera:
         """Assert that the camera is ready. Raises a `CameraNotReadyError` if
         the camera is not ready.
         """
-        if not self.isReady:
+        if not self._isReady:
             raise CameraNotReadyError("Camera is not ready.")
 
     @property
@@ -1492,7 +1719,7 @@ class Camera:
         # self documenting and prevent the user from touching the status flag
         # attribute directly.
         #
-        return self.status == RECORDING
+        return self._status == RECORDING
 
     @property
     def isNotStarted(self):
@@ -1500,7 +1727,7 @@ class Camera:
         is given before `open()` or after `close()` has been called on this
         object.
         """
-        return self.status == NOT_STARTED
+        return self._status == NOT_STARTED
 
     @property
     def isStopped(self):
@@ -1508,7 +1735,7 @@ class Camera:
         the stream has stopped, `getVideoFrame()` will still yield frames until
         `close()` is called.
         """
-        return self.status == STOPPED
+        return self._status == STOPPED
 
     @property
     def metadata(self):
@@ -1755,14 +1982,21 @@ class Camera:
 
         raise PlayerNotAvailableError('Media player not initialized.')
 
-    def _enqueueFrame(self):
+    def _enqueueFrame(self, timeout=0.0):
         """Grab the latest frame from the stream.
 
+        Parameters
+        ----------
+        timeout : float
+            Amount of time to wait for a frame to arrive in seconds. If zero
+            (the default), return immediately when no frame is available.
+
         Returns
         -------
         bool
             `True` if a frame has been enqueued. Returns `False` if the camera
-            is not ready or if the stream was closed.
+            is not ready, the stream was closed, or we timed out waiting for a
+            frame.
 
         """
         self._assertMediaPlayer()
@@ -1771,7 +2005,18 @@ class Camera:
         # since the last call.
         enqueuedFrame = self._tStream.getRecentFrame()
 
-        if enqueuedFrame is None:
+        # If requested, wait for a frame to arrive. We sleep briefly between
+        # polls instead of spinning on the queue so we don't pin a core while
+        # the stream is starved of frames.
+        if enqueuedFrame is None and timeout > 0.0:
+            tStart = time.monotonic()
+            while (time.monotonic() - tStart) < timeout:
+                enqueuedFrame = self._tStream.getRecentFrame()
+                if enqueuedFrame is not None:
+                    break
+                time.sleep(0.0005)
+
+        if enqueuedFrame is None:  # no frame available or timed out
             return False
 
         # unpack the data we got back
@@ -1786,22 +2031,36 @@ class Camera:
 
         # self._isReady = streamStatus.status >= STARTED
 
-        # if we have a new frame, update the frame information
-        videoBuffer = frameImage.to_bytearray()[0]
+        # If we have a new frame, update the frame information. We use a
+        # zero-copy view of the decoder's buffer here since `to_bytearray()`
+        # would copy the whole frame into a fresh Python `bytearray` on every
+        # call, which is quite costly for high-resolution streams.
+        videoBuffer = frameImage.to_memoryview()[0]
         videoFrameArray = np.frombuffer(videoBuffer, dtype=np.uint8)
 
+        # Update one of the pre-allocated frame descriptors in place and make
+        # it current. The slots are written alternately so a consumer still
+        # holding the previous frame won't see its fields change mid-read.
+        thisFrame = self._frameSlots[self._frameSlotIdx]
+        self._frameSlotIdx ^= 1
+
+        thisFrame.frameIndex = self._frameIndex
+        thisFrame.absTime = streamStatus.recTime
+        # thisFrame.displayTime = self._recentMetadata['frame_size']
+        thisFrame.size = frameImage.get_size()
+        thisFrame.colorData = videoFrameArray
+        thisFrame.audioChannels = 0
+        thisFrame.audioSamples = None
+        thisFrame.metadata = metadata
+        thisFrame.movieLib = u'ffpyplayer'
+
+        # The frame travels with a reference to the decoder image that owns
+        # the buffer backing `colorData`, keeping it alive for as long as the
+        # frame itself may be read.
+        thisFrame.userData['_imgRef'] = frameImage
+
         # provide the last frame
-        self._lastFrame = MovieFrame(
-            frameIndex=self._frameIndex,
-            absTime=streamStatus.recTime,
-            # displayTime=self._recentMetadata['frame_size'],
-            size=frameImage.get_size(),
-            colorData=videoFrameArray,
-            audioChannels=0,
-            audioSamples=None,
-            metadata=metadata,
-            movieLib=u'ffpyplayer',
-            userData=None)
+        self._lastFrame = thisFrame
 
         return True
 
@@ -1933,16 +2192,25 @@ class Camera:
         self._tStream.stop()
         self._isReady = False  # not ready
 
-        # Close the writer file (not thread) now that the stream thread is no
-        # longer writing frames.
-        self._tWriter.close()
+        # Closing the writer file flushes frames still queued for encode,
+        # while saving the audio track is mostly disk-bound. Neither depends
+        # on the other, so finalize both concurrently - the stall here
+        # becomes the longer of the two rather than their sum.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            finalizers = [executor.submit(self._tWriter.close)]
+            if self._mic is not None:
+                finalizers.append(executor.submit(self._stopAudioRecording))
 
-        # stop audio recording if `mic` is available
-        if self._mic is not None:
-            if self._mic.isStarted:
-                self._mic.stop()
-            audioTrack = self._mic.getRecording()
-            audioTrack.save(self._tempAudioFileName, 'wav')
+            for fut in finalizers:
+                fut.result()  # re-raises any error from the workers
+
+    def _stopAudioRecording(self):
+        """Stop the microphone and save its recording to the temp audio file.
+        """
+        if self._mic.isStarted:
+            self._mic.stop()
+        audioTrack = self._mic.getRecording()
+        audioTrack.save(self._tempAudioFileName, 'wav')
 
     def close(self):
         """Close the camera.
@@ -2083,6 +2351,41 @@ class Camera:
 
         return self._lastFrame
 
+    def getVideoFrameRGB(self):
+        """Pull the next frame from the stream (if available) as an RGB image.
+
+        Unlike `getVideoFrame`, the flat frame buffer is returned shaped
+        `(h, w, 3)` with RGB pixel values, converting from the stream's pixel
+        format where needed. Conversion from `'yuyv422'` is done with
+        vectorized NumPy arithmetic, which is far cheaper than consumers
+        converting pixels in Python downstream.
+
+        Returns
+        -------
+        ndarray or None
+            RGB image array with shape `(h, w, 3)` and dtype `uint8`. Returns
+            `None` if no frame has been acquired yet.
+
+        """
+        self.update()
+
+        frameImage = self._lastFrame.userData.get('_imgRef')
+        if frameImage is None:  # no frame acquired yet
+            return None
+
+        frameWidth, frameHeight = self._lastFrame.size
+        pixelFormat = frameImage.get_pixel_format()
+
+        if pixelFormat == 'rgb24':  # already RGB, just needs shaping
+            return np.asarray(self._lastFrame.colorData).reshape(
+                frameHeight, frameWidth, 3)
+        elif pixelFormat == 'yuyv422':
+            return _yuyv422ToRGB(
+                self._lastFrame.colorData, frameWidth, frameHeight)
+
+        raise CameraFormatNotSupportedError(
+            "Cannot convert pixel format '{}' to RGB.".format(pixelFormat))
+
     def __del__(self):
         """Try to cleanly close the camera and output file.
         """
@@ -2133,6 +2436,91 @@ class Camera:
 # Functions
 #
 
+def _setCurrentThreadPriority(highPriority):
+    """Raise or restore the scheduling priority of the calling thread.
+
+    Used by the stream reader thread to reduce scheduling latency (and with
+    it, dropped frames) while a recording is in progress. Elevated priority
+    is only a request to the operating system; failures such as insufficient
+    privileges are logged and otherwise ignored.
+
+    Parameters
+    ----------
+    highPriority : bool
+        Raise the priority of the calling thread if `True`, otherwise restore
+        the platform default.
+
+    """
+    try:
+        if _SYSTEM == 'Windows':
+            import ctypes
+            THREAD_PRIORITY_NORMAL = 0
+            THREAD_PRIORITY_TIME_CRITICAL = 15
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(
+                kernel32.GetCurrentThread(),
+                THREAD_PRIORITY_TIME_CRITICAL if highPriority
+                else THREAD_PRIORITY_NORMAL)
+        elif hasattr(os, 'sched_setscheduler'):  # Linux
+            if highPriority:
+                policy = os.SCHED_FIFO
+                priority = os.sched_get_priority_min(policy)
+            else:
+                policy = os.SCHED_OTHER
+                priority = 0
+            os.sched_setscheduler(0, policy, os.sched_param(priority))
+    except (OSError, AttributeError) as err:  # includes PermissionError
+        logging.debug(
+            "Failed to change camera stream thread priority ({}).".format(
+                err))
+
+
+def _yuyv422ToRGB(videoBuffer, frameWidth, frameHeight):
+    """Convert a packed YUYV422 frame to RGB.
+
+    The conversion is fully vectorized; the buffer is viewed as an array of
+    luma/chroma pairs and a fixed-point BT.601 matrix is applied over whole
+    planes at once instead of per-pixel in Python.
+
+    Parameters
+    ----------
+    videoBuffer : ArrayLike
+        Flat `uint8` buffer of packed YUYV422 pixel data, at least
+        `frameWidth * frameHeight * 2` bytes long.
+    frameWidth : int
+        Width of the frame in pixels.
+    frameHeight : int
+        Height of the frame in pixels.
+
+    Returns
+    -------
+    ndarray
+        RGB image array with shape `(frameHeight, frameWidth, 3)` and dtype
+        `uint8`.
+
+    """
+    packed = np.frombuffer(
+        videoBuffer, dtype=np.uint8, count=frameWidth * frameHeight * 2)
+    packed = packed.reshape(frameHeight, frameWidth, 2)
+
+    # Split out luma and the interleaved chroma channels. Each chroma sample
+    # is shared by a pair of horizontally adjacent pixels.
+    luma = packed[:, :, 0].astype(np.int32)
+    chroma = packed[:, :, 1].astype(np.int32) - 128
+    chromaU = np.repeat(chroma[:, 0::2], 2, axis=1)
+    chromaV = np.repeat(chroma[:, 1::2], 2, axis=1)
+
+    # fixed-point BT.601 conversion
+    c = (luma - 16) * 298
+    r = (c + 409 * chromaV + 128) >> 8
+    g = (c - 100 * chromaU - 208 * chromaV + 128) >> 8
+    b = (c + 516 * chromaU + 128) >> 8
+
+    rgb = np.stack((r, g, b), axis=-1)
+
+    return np.clip(rgb, 0, 255, out=rgb).astype(np.uint8)
+
+
 def _getCameraInfoMacOS():
     """Get a list of capabilities for the specified associated with a camera
     attached to the system.
@@ -2146,7 +2534,7 @@ def _getCameraInfoMacOS():
         List of camera descriptors.
 
     """
-    if platform.system() != 'Darwin':
+    if _SYSTEM != 'Darwin':
         raise OSError(
             "Cannot query cameras with this function, platform not 'Darwin'.")
 
@@ -2235,7 +2623,7 @@ def _getCameraInfoWindows():
         List of camera descriptors.
 
     """
-    if platform.system() != 'Windows':
+    if _SYSTEM != 'Windows':
         raise OSError(
             "Cannot query cameras with this function, platform not 'Windows'.")
 
@@ -2245,12 +2633,13 @@ def _getCameraInfoWindows():
     # get all the supported modes for the camera
     videoDevices = {}
 
-    # iterate over names
+    # iterate over devices, taking the formats along to avoid a second dict
+    # lookup per device
     devIndex = 0
-    for devURI in videoDevs.keys():
+    for devURI, formats in videoDevs.items():
         supportedFormats = []
-        cameraName = names[devURI]
-        for _format in videoDevs[devURI]:
+        cameraName = names.get(devURI, devURI)
+        for _format in formats:
             pixelFormat, codecFormat, frameSize, frameRateRng = _format
             _, frameRateMax = frameRateRng
             temp = CameraInfo(
@@ -2265,7 +2654,47 @@ def _getCameraInfoWindows():
             supportedFormats.append(temp)
             devIndex += 1
 
-        videoDevices[names[devURI]] = supportedFormats
+        videoDevices[cameraName] = supportedFormats
+
+    return videoDevices
+
+
+def _getCameraInfoLinux():
+    """Get a list of capabilities for the specified associated with a camera
+    attached to the system.
+
+    This is used by `getCameraInfo()` for querying camera details on Linux.
+    Don't call this function directly unless testing. Presently, only the
+    device nodes are enumerated; formats cannot be queried without opening
+    the stream first.
+
+    Returns
+    -------
+    list of CameraInfo
+        List of camera descriptors.
+
+    """
+    if _SYSTEM != 'Linux':
+        raise OSError(
+            "Cannot query cameras with this function, platform not 'Linux'.")
+
+    # Find V4L device nodes under `/dev`. Using `os.scandir` here avoids
+    # building a list of every entry in the directory and pattern matching
+    # each of them like `glob` would.
+    with os.scandir(VIDEO_DEVICE_ROOT_LINUX) as allDevices:
+        foundCameras = sorted(
+            entry.name for entry in allDevices
+            if entry.name.startswith('video'))
+
+    videoDevices = {}
+    for devIndex, devName in enumerate(foundCameras):
+        devPath = os.path.join(VIDEO_DEVICE_ROOT_LINUX, devName)
+        thisCamInfo = CameraInfo(
+            index=devIndex,
+            name=devPath,
+            cameraAPI=CAMERA_API_VIDEO4LINUX
+        )
+        videoDevices[devPath] = [thisCamInfo]
 
     return videoDevices
 
@@ -2273,16 +2702,30 @@ def _getCameraInfoWindows():
 # Mapping for platform specific camera getter functions used by `getCameras`.
 _cameraGetterFuncTbl = {
     'Darwin': _getCameraInfoMacOS,
-    'Windows': _getCameraInfoWindows
+    'Windows': _getCameraInfoWindows,
+    'Linux': _getCameraInfoLinux
 }
 
 
-def getCameras():
+# Cached camera enumeration results. Asking the OS for cameras is costly
+# (hundreds of milliseconds through DirectShow), so the results of the first
+# query are kept for the session and reused on subsequent calls.
+_cameraEnumerationCache = None
+
+
+def getCameras(refresh=False):
     """Get information about installed cameras and their formats on this system.
 
     Use `getCameraDescriptions` to get a mapping or list of human-readable
     camera formats.
 
+    Parameters
+    ----------
+    refresh : bool
+        Query the operating system again instead of returning the cached
+        results of a previous call. Use this if cameras may have been plugged
+        in or removed since the last enumeration. Default is `False`.
+
     Returns
     -------
     dict
@@ -2290,16 +2733,40 @@ def getCameras():
         `CameraInfo` objects.
 
     """
-    systemName = platform.system()  # get the system name
+    global _cameraEnumerationCache
+    if not refresh and _cameraEnumerationCache is not None:
+        return _cameraEnumerationCache
 
-    # lookup the function for the given platform
-    getCamerasFunc = _cameraGetterFuncTbl.get(systemName, None)
+    # lookup the function for this platform
+    getCamerasFunc = _cameraGetterFuncTbl.get(_SYSTEM, None)
     if getCamerasFunc is None:  # if unsupported
         raise OSError(
             "Cannot get cameras, unsupported platform '{}'.".format(
-                systemName))
+                _SYSTEM))
+
+    _cameraEnumerationCache = getCamerasFunc()
+
+    return _cameraEnumerationCache
+
 
-    return getCamerasFunc()
+def getCameraTable():
+    """Get installed camera formats as a `CameraInfoTable`.
+
+    The table holds the same information as `getCameras` but in a tabular,
+    structure-of-arrays layout which supports vectorized queries over all
+    formats at once (e.g. `table.supportedFrameRate(60)`).
+
+    Returns
+    -------
+    CameraInfoTable
+        Table of all camera formats found on this system.
+
+    """
+    allFormats = []
+    for _, formats in getCameras().items():
+        allFormats.extend(formats)
+
+    return CameraInfoTable(allFormats)
 
 
 def getCameraDescriptions(collapse=False):
@@ -2377,17 +2844,28 @@ def renderVideo(outputFile, videoFile, audioFile=None):
         Size of the resulting file in bytes.
 
     """
-    # merge audio and video tracks, we use MoviePy for this
-    videoClip = VideoFileClip(videoFile)
-
-    # if we have a microphone, merge the audio track in
+    # locate the ffmpeg binary bundled with `imageio-ffmpeg`
+    from imageio_ffmpeg import get_ffmpeg_exe
+
+    # Build the command to mux the tracks with ffmpeg directly. The video
+    # track is stream-copied into the output container instead of being
+    # decoded to frames and re-encoded as MoviePy would do, making this an
+    # O(container rewrite) operation with no generational quality loss.
+    cmd = [get_ffmpeg_exe(), '-y', '-i', videoFile]
     if audioFile is not None:
-        audioClip = AudioFileClip(audioFile)
-        # add audio track to the video
-        videoClip.audio = CompositeAudioClip([audioClip])
-
-    # transcode with the format the user wants
-    videoClip.write_videofile(outputFile, verbose=False, logger=None)
+        cmd += ['-i', audioFile, '-c:v', 'copy', '-c:a', 'aac', '-shortest']
+    else:
+        cmd += ['-c:v', 'copy']
+    cmd.append(outputFile)
+
+    result = subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise RuntimeError(
+            "Failed to composite video file `{}`, ffmpeg exited with code "
+            "{}:\n{}".format(
+                outputFile, result.returncode,
+                result.stderr.decode('utf-8', errors='replace')))
 
     return os.path.getsize(outputFile)
 
@@ -0,0 +1,44 @@
+"""Tests for psychopy.hardware.camera"""
+
+import pytest
+
+pytest.importorskip('ffpyplayer')
+
+from psychopy.hardware.camera import CameraInfo, CameraInfoTable
+
+
+class TestCameraInfoTable:
+    """Tests for the tabular (structure-of-arrays) camera format store."""
+    def test_fromDefaultConstructed(self):
+        """Default descriptor fields, including the `(-1, -1)` frame rate
+        tuple, must not break table construction.
+        """
+        table = CameraInfoTable([CameraInfo()])
+
+        assert len(table) == 1
+        assert table.frameRates[0] == -1.0
+
+    def test_roundTrip(self):
+        """A descriptor rebuilt from a table row must carry the same fields
+        as the one the table was built from.
+        """
+        source = CameraInfo(
+            index=0,
+            name='testCam',
+            frameSize=(640, 480),
+            frameRate=30.0,
+            pixelFormat='yuyv422',
+            cameraLib='ffpyplayer')
+        restored = CameraInfoTable([source]).getCameraInfo(0)
+
+        assert restored.name == source.name
+        assert restored.frameSize == source.frameSize
+        assert restored.frameRate == source.frameRate
+        assert restored.pixelFormat == source.pixelFormat
+        assert restored.codecFormat == source.codecFormat
+        assert restored.cameraLib == source.cameraLib
+        assert restored.cameraAPI == source.cameraAPI
+
+
+if __name__ == "__main__":
+    pytest.main()